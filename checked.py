@@ -0,0 +1,352 @@
+#
+# Gagnaskipan.
+# Fail-fast (debug) versions of the lists
+# Student(s):
+#  - Ísak Elí Hauksson
+#
+# DLList and SLList do no misuse checks at all. The subclasses below add
+# modification counters and Position ownership/generation checks, so code
+# can be run against them while debugging and against the plain lists
+# (with zero overhead) otherwise, e.g. Deque(CheckedDLList()).
+#
+from dll import DLList, Position, Cursor
+from sll import SLList
+
+
+class CheckedPosition(Position):
+    __slots__ = ["owner", "generation"]
+
+    def __init__(self, node, owner, generation: int):
+        super().__init__(node)
+        self.owner = owner
+        self.generation = generation
+
+
+class CheckedIterator:
+    def __init__(self, lst, iterator):
+        self.__lst = lst
+        self.__iterator = iterator
+        self.__mod_count = lst._mod_count
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.__lst._mod_count != self.__mod_count:
+            raise RuntimeError("list changed during iteration")
+        return next(self.__iterator)
+
+
+class CheckedCursor(Cursor):
+    __slots__ = []
+
+    def _check(self) -> None:
+        """
+        Helper function, raises if the element under the cursor was removed
+        by someone else.
+
+        :raises IndexError: Stale cursor
+        """
+        node = self._node
+        if not node.sentinel and node not in self._lst._live:
+            raise IndexError("Stale cursor (element was removed)")
+
+    def is_valid(self) -> bool:
+        self._check()
+        return super().is_valid()
+
+    @property
+    def item(self) -> object:
+        self._check()
+        return Cursor.item.fget(self)
+
+    def advance(self) -> bool:
+        self._check()
+        return super().advance()
+
+    def retreat(self) -> bool:
+        self._check()
+        return super().retreat()
+
+    def position(self) -> Position:
+        self._check()
+        super().position()
+        return self._lst._make_pos(self._node)
+
+    def insert_here(self, item: object) -> None:
+        self._check()
+        lst = self._lst
+
+        # The new node is linked right after this one
+        node = self._node
+        prev = node if node is lst.sentinel_front else node.prev
+        super().insert_here(item)
+
+        lst._register(prev.next)
+
+    def remove_here(self) -> object:
+        self._check()
+        node = self._node
+        item = super().remove_here()
+
+        self._lst._unregister(node)
+        return item
+
+    def replace_here(self, item: object) -> object:
+        self._check()
+        return super().replace_here(item)
+
+
+class CheckedDLList(DLList):
+    """
+    DLList that raises immediately on misuse:
+
+    - `IndexError` for a Position from another list, a Position whose
+      element was removed, or inserting outside the sentinels.
+    - `RuntimeError` if the list changes while it is being iterated.
+    """
+
+    __slots__ = ["_mod_count", "_generation", "_live"]
+
+    def __init__(self):
+        super().__init__()
+        self._mod_count = 0
+        self._generation = 0
+        # Node -> generation it was inserted with
+        self._live: dict = {}
+
+    def _register(self, node) -> None:
+        """
+        Helper function, records a newly linked node.
+        """
+        self._generation += 1
+        self._live[node] = self._generation
+        self._mod_count += 1
+
+    def _unregister(self, node) -> None:
+        """
+        Helper function, forgets an unlinked node.
+        """
+        del self._live[node]
+        self._mod_count += 1
+
+    def _make_pos(self, node) -> CheckedPosition:
+        """
+        Helper function, returns a Position stamped with owner and generation.
+        """
+        return CheckedPosition(node, self, self._live[node])
+
+    def _check_pos(self, pos: Position, sentinel=None) -> None:
+        """
+        Helper function that validates a Position.
+        Plain Positions are only accepted for the given sentinel, which is
+        how DLList's own push_front/push_back call insert_after/insert_before.
+
+        :raises IndexError: Invalid, foreign or stale position
+        """
+        if isinstance(pos, CheckedPosition):
+            if pos.owner is not self:
+                raise IndexError("Position belongs to another list")
+            if self._live.get(pos.node) != pos.generation:
+                raise IndexError("Stale position (element was removed)")
+        elif pos is None or sentinel is None or pos.node is not sentinel:
+            raise IndexError("Invalid position")
+
+    def __iter__(self) -> CheckedIterator:
+        return CheckedIterator(self, super().__iter__())
+
+    def __reversed__(self) -> CheckedIterator:
+        return CheckedIterator(self, super().__reversed__())
+
+    def get_at(self, pos: Position) -> object:
+        self._check_pos(pos)
+        return super().get_at(pos)
+
+    def insert_after(self, pos: Position, item: object) -> Position:
+        self._check_pos(pos, self.sentinel_front)
+        node = super().insert_after(pos, item).node
+        self._register(node)
+        return self._make_pos(node)
+
+    def insert_before(self, pos: Position, item: object) -> Position:
+        self._check_pos(pos, self.sentinel_back)
+        node = super().insert_before(pos, item).node
+        self._register(node)
+        return self._make_pos(node)
+
+    def remove(self, pos: Position) -> object:
+        self._check_pos(pos)
+        node = pos.node
+        item = super().remove(pos)
+        self._unregister(node)
+        return item
+
+    def replace(self, pos: Position, item: object) -> object:
+        self._check_pos(pos)
+        return super().replace(pos, item)
+
+    def front_pos(self) -> Position | None:
+        if self.is_empty():
+            return None
+        return self._make_pos(self.sentinel_front.next)
+
+    def back_pos(self) -> Position | None:
+        if self.is_empty():
+            return None
+        return self._make_pos(self.sentinel_back.prev)
+
+    def prev_pos(self, pos: Position) -> Position | None:
+        self._check_pos(pos)
+        prev = super().prev_pos(pos)
+        return None if prev is None else self._make_pos(prev.node)
+
+    def next_pos(self, pos: Position) -> Position | None:
+        self._check_pos(pos)
+        next = super().next_pos(pos)
+        return None if next is None else self._make_pos(next.node)
+
+    def rotate(self, k: int = 1) -> None:
+        super().rotate(k)
+        self._mod_count += 1
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._mod_count += 1
+
+    def _recycle_front(self, item) -> object:
+        # The reused node holds a new element, so it gets a new generation
+        node = self.sentinel_front.next
+        existing_item = super()._recycle_front(item)
+        self._unregister(node)
+        self._register(node)
+        return existing_item
+
+    def _recycle_back(self, item) -> object:
+        node = self.sentinel_back.prev
+        existing_item = super()._recycle_back(item)
+        self._unregister(node)
+        self._register(node)
+        return existing_item
+
+    def cursor(self) -> CheckedCursor:
+        return CheckedCursor(self, self.sentinel_front.next)
+
+    def remove_if(self, pred) -> int:
+        removed = 0
+        cursor = self.cursor()
+        while cursor.is_valid():
+            if pred(cursor.item):
+                cursor.remove_here()
+                removed += 1
+            else:
+                cursor.advance()
+        return removed
+
+    def walk(self, pos=None, steps=None, reverse=False) -> CheckedIterator:
+        if pos is not None:
+            self._check_pos(pos)
+        return CheckedIterator(self, super().walk(pos, steps, reverse))
+
+    def tail(self, n: int) -> CheckedIterator:
+        return CheckedIterator(self, super().tail(n))
+
+
+class CheckedSLList(SLList):
+    """
+    SLList that raises `RuntimeError` if the list changes while it is
+    being iterated.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._mod_count = 0
+
+    def __iter__(self):
+        return CheckedIterator(self, super().__iter__())
+
+    def push_front(self, item) -> None:
+        super().push_front(item)
+        self._mod_count += 1
+
+    def pop_front(self):
+        super().pop_front()
+        self._mod_count += 1
+
+    def push_back(self, item):
+        super().push_back(item)
+        self._mod_count += 1
+
+    def pop_back(self):
+        super().pop_back()
+        self._mod_count += 1
+
+    def rotate(self, k=1):
+        super().rotate(k)
+        self._mod_count += 1
+
+    def reverse(self):
+        super().reverse()
+        self._mod_count += 1
+
+
+def _expect_stale(lst: CheckedDLList, pos: Position) -> None:
+    try:
+        lst.get_at(pos)
+    except IndexError:
+        return
+    raise AssertionError("stale Position was not detected")
+
+
+def self_check() -> None:
+    """
+    Checks that Positions of elements evicted from a full bounded Deque
+    are detected as stale, even though the evicted node is reused.
+
+    :raises AssertionError: If a stale Position is not detected
+    """
+    from deque import Deque
+
+    lst = CheckedDLList()
+    deque = Deque(lst, 2)
+    deque.append(1)
+    deque.append(2)
+
+    front = lst.front_pos()
+    deque.append(3)
+    _expect_stale(lst, front)
+
+    back = lst.back_pos()
+    deque.appendleft(0)
+    _expect_stale(lst, back)
+
+    assert [lst.get_at(lst.front_pos()), lst.get_at(lst.back_pos())] == [0, 2]
+
+
+def _bench(cls, n: int) -> float:
+    import time
+
+    start = time.perf_counter()
+    lst = cls()
+    for i in range(n):
+        lst.push_back(i)
+    for _ in lst:
+        pass
+    while not lst.is_empty():
+        lst.pop_front()
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Benchmark the plain lists against the checked ones. The plain lists
+    contain no checks, so their timings are the same as without this module.
+    """
+    self_check()
+
+    n = 200_000
+    for cls in (DLList, CheckedDLList, SLList, CheckedSLList):
+        print(f"{cls.__name__:15} {_bench(cls, n):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,11 +10,23 @@ from dll import DLList
 
 
 class Deque:
-    def __init__(self, lst: SLList | DLList):
+    def __init__(self, lst: SLList | DLList, maxlen: int | None = None):
         """
         Constructor.
+        If maxlen is given the deque is bounded: appending to a full deque
+        evicts an element from the opposite end, like collections.deque.
+        :raises ValueError: If maxlen is negative.
         """
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
+
         self._lst = lst
+        self._maxlen = maxlen
+
+        # Keep the rightmost maxlen elements, as collections.deque does
+        if maxlen is not None:
+            while len(self._lst) > maxlen:
+                self._lst.pop_front()
 
     def __len__(self):
         """
@@ -30,6 +42,43 @@ class Deque:
         """
         return str(self._lst)
 
+    def __repr__(self):
+        """
+        Returns the truncated string representation of the deque.
+        :return: String representation.
+        """
+        return repr(self._lst)
+
+    def __iter__(self):
+        """
+        Iterates the deque from the front (left) to the back (right).
+        :return: Iterator object.
+        """
+        return iter(self._lst)
+
+    def __reversed__(self):
+        """
+        Iterates the deque from the back (right) to the front (left),
+        without copying. Requires a DLList.
+        :raises TypeError: If the deque is backed by an SLList.
+        :return: Iterator object.
+        """
+        if not hasattr(self._lst, "__reversed__"):
+            raise TypeError(
+                "reversed() needs a DLList-backed Deque, "
+                f"{type(self._lst).__name__} has no backward links"
+            )
+        return reversed(self._lst)
+
+    def write(self, file, limit=None):
+        """
+        Writes the deque to a file object element by element.
+        :param file: Object with a write(str) method
+        :param limit: Maximum number of elements written, unbounded if None
+        :return: None
+        """
+        self._lst.write(file, limit)
+
     def is_empty(self):
         """
         Returns True if the deque is empty, otherwise False.
@@ -50,19 +99,40 @@ class Deque:
         """
         return self._lst.back()
 
+    @property
+    def maxlen(self):
+        """
+        Returns the maximum size of the deque, or None if unbounded.
+        """
+        return self._maxlen
+
+    def _is_full(self):
+        """
+        Helper function, True if the deque is bounded and at its maximum size.
+        """
+        return self._maxlen is not None and len(self._lst) >= self._maxlen
+
     def append(self, item):
         """
         Inserts the element to the right (back) of the deque.
+        If the deque is full, the front element is evicted and its node reused.
         :return: None
         """
-        self._lst.push_back(item)
+        if not self._is_full():
+            self._lst.push_back(item)
+        elif self._maxlen > 0:
+            self._lst._recycle_front(item)
 
     def appendleft(self, item):
         """
         Inserts the element to the left (front) of the deque.
+        If the deque is full, the back element is evicted and its node reused.
         :return: None
         """
-        self._lst.push_front(item)
+        if not self._is_full():
+            self._lst.push_front(item)
+        elif self._maxlen > 0:
+            self._lst._recycle_back(item)
 
     def pop(self):
         """
@@ -77,3 +147,19 @@ class Deque:
         :return: None. Raises an exception if empty.
         """
         self._lst.pop_front()
+
+    def rotate(self, k=1):
+        """
+        Rotates the deque k steps to the right (to the left if k is negative).
+        Time complexity: O(min(k, n - k)) on a DLList.
+        :return: None
+        """
+        self._lst.rotate(k)
+
+    def reverse(self):
+        """
+        Reverses the deque in place.
+        Time complexity: O(n)
+        :return: None
+        """
+        self._lst.reverse()
@@ -4,8 +4,10 @@
 # Student(s):
 #  - Ísak Elí Hauksson
 #
+import io
+
 from dll_node import Node
-from iterator import NodeIterator
+from iterator import NodeIterator, BoundedNodeIterator, write_items
 
 
 class Position:
@@ -15,6 +17,151 @@ class Position:
         self.node = node
 
 
+class Cursor:
+    """
+    Reusable cursor over a DLList that moves in place.
+
+    - `advance()` / `retreat()`: Step to the next / previous element.
+    - `seek_front()` / `seek_back()`: Jump to the first / last element.
+    - `insert_here(item)`: Insert before the current element.
+    - `remove_here()`: Remove the current element and step to the next one.
+    - `replace_here(item)`: Replace the current element.
+
+    Stepping past either end leaves the cursor on that end's sentinel,
+    where `is_valid()` is False.
+    """
+
+    __slots__ = ["_lst", "_node"]
+
+    def __init__(self, lst: "DLList", node: Node):
+        self._lst = lst
+        self._node = node
+
+    def is_valid(self) -> bool:
+        """
+        Returns True if the cursor is on an element (not past either end).
+        """
+        return not self._node.sentinel
+
+    @property
+    def item(self) -> object:
+        """
+        Returns the element under the cursor.
+
+        :raises IndexError: If the cursor is past either end
+        """
+        if self._node.sentinel:
+            raise IndexError("Cursor is not on an element")
+        return self._node.item
+
+    def position(self) -> Position:
+        """
+        Returns a Position for the element under the cursor.
+
+        :raises IndexError: If the cursor is past either end
+        """
+        if self._node.sentinel:
+            raise IndexError("Cursor is not on an element")
+        return Position(self._node)
+
+    def advance(self) -> bool:
+        """
+        Step to the next element.
+        Time complexity: O(1)
+
+        :return: True if the cursor is now on an element
+        """
+        if self._node is not self._lst.sentinel_back:
+            self._node = self._node.next
+        return not self._node.sentinel
+
+    def retreat(self) -> bool:
+        """
+        Step to the previous element.
+        Time complexity: O(1)
+
+        :return: True if the cursor is now on an element
+        """
+        if self._node is not self._lst.sentinel_front:
+            self._node = self._node.prev
+        return not self._node.sentinel
+
+    def seek_front(self) -> bool:
+        """
+        Move to the first element.
+
+        :return: True if the cursor is now on an element (list non-empty)
+        """
+        self._node = self._lst.sentinel_front.next
+        return not self._node.sentinel
+
+    def seek_back(self) -> bool:
+        """
+        Move to the last element.
+
+        :return: True if the cursor is now on an element (list non-empty)
+        """
+        self._node = self._lst.sentinel_back.prev
+        return not self._node.sentinel
+
+    def insert_here(self, item: object) -> None:
+        """
+        Insert an element before the one under the cursor, or at the front
+        if the cursor is before the front. The cursor does not move.
+        Time complexity: O(1)
+
+        :param item: Element to insert
+        :return: None
+        """
+        node = self._node
+        if node is self._lst.sentinel_front:
+            node = node.next
+        prev = node.prev
+
+        new_node = Node(item, next=node, prev=prev)
+        prev.next = new_node
+        node.prev = new_node
+
+        self._lst._size += 1
+
+    def remove_here(self) -> object:
+        """
+        Remove the element under the cursor and step to the next one.
+        Time complexity: O(1)
+
+        :raises IndexError: If the cursor is past either end
+        :return: Element deleted
+        """
+        node = self._node
+        if node.sentinel:
+            raise IndexError("Cursor is not on an element")
+
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        self._node = node.next
+
+        node.next, node.prev = None, None
+        self._lst._size -= 1
+
+        return node.item
+
+    def replace_here(self, item: object) -> object:
+        """
+        Replace the element under the cursor.
+        Time complexity: O(1)
+
+        :raises IndexError: If the cursor is past either end
+        :return: The element replaced
+        """
+        node = self._node
+        if node.sentinel:
+            raise IndexError("Cursor is not on an element")
+
+        existing_item = node.item
+        node.item = item
+        return existing_item
+
+
 class DLList:
     """
     **Methods For Both SLL and DLL**
@@ -26,8 +173,24 @@ class DLList:
     - `push_back(item)`: Insert `item` at the back.
     - `pop_front()`: Remove first item return None.
     - `pop_back()`: Remove last item return None.
+    - `replace_front(item)`: Replace the first item, return the old one.
+    - `replace_back(item)`: Replace the last item, return the old one.
+    - `rotate(k)`: Rotate `k` steps to the right (left if negative).
+    - `reverse()`: Reverse the list in place.
+
+    **DLList Only**
+
+    - `cursor()`: Cursor on the first item, see Cursor.
+    - `remove_if(pred)`: Remove every item where `pred(item)` is true.
+    - `filter_in_place(pred)`: Keep only items where `pred(item)` is true.
+    - `walk(pos, steps, reverse)`: Lazily iterate a bounded number of items.
+    - `head(n)` / `tail(n)`: Lazily iterate the first / last `n` items.
+    - `write(file, limit)`: Stream the list to a file object.
     """
 
+    # Number of elements shown by repr() before truncating
+    REPR_LIMIT = 100
+
     __slots__ = [
         "sentinel_front",
         "sentinel_back",
@@ -65,6 +228,27 @@ class DLList:
         """
         return "[" + ", ".join(str(x) for x in self) + "]"
 
+    def __repr__(self):
+        """
+        Truncated string representation, showing at most REPR_LIMIT elements.
+        Time complexity: O(REPR_LIMIT)
+
+        :return: The string representation.
+        """
+        out = io.StringIO()
+        self.write(out, self.REPR_LIMIT)
+        return out.getvalue()
+
+    def __reversed__(self) -> BoundedNodeIterator:
+        """
+        Iterate from the back to the front without copying.
+
+        :return: Iterator object.
+        """
+        return BoundedNodeIterator(
+            self.sentinel_back.prev, self.sentinel_front, None, reverse=True
+        )
+
     def __len__(self):
         """
         Returns the number of elements in the list.
@@ -342,3 +526,224 @@ class DLList:
         pos: Position = self._get_endpoint("back")
 
         self.remove(pos)
+
+    def replace_front(self, item) -> object:
+        """
+        Replace the element at the front of the list.
+        Time complexity: O(1)
+
+        :param item: New element
+        :return: The element replaced, but trows an exception if list empty.
+        """
+        return self.replace(self._get_endpoint("front"), item)
+
+    def replace_back(self, item) -> object:
+        """
+        Replace the element at the back of the list.
+        Time complexity: O(1)
+
+        :param item: New element
+        :return: The element replaced, but trows an exception if list empty.
+        """
+        return self.replace(self._get_endpoint("back"), item)
+
+    def _recycle_front(self, item) -> object:
+        """
+        Helper function for bounded deques: evicts the front element and
+        reuses its node to append 'item' at the back.
+        Time complexity: O(1)
+
+        :param item: New element
+        :return: The element evicted, but trows an exception if list empty.
+        """
+        existing_item = self.replace_front(item)
+        self.rotate(-1)
+        return existing_item
+
+    def _recycle_back(self, item) -> object:
+        """
+        Helper function for bounded deques: evicts the back element and
+        reuses its node to prepend 'item' at the front.
+        Time complexity: O(1)
+
+        :param item: New element
+        :return: The element evicted, but trows an exception if list empty.
+        """
+        existing_item = self.replace_back(item)
+        self.rotate(1)
+        return existing_item
+
+    def rotate(self, k: int = 1) -> None:
+        """
+        Rotate the list k steps to the right (to the left if k is negative).
+        Relinks the nodes next to the sentinels, no nodes are allocated.
+        Time complexity: O(min(k, n - k))
+
+        :param k: Number of steps
+        :return: None
+        """
+        n = self._size
+        if n <= 1:
+            return
+
+        k %= n
+        if k == 0:
+            return
+
+        # Find the node that becomes the new front, walking from the closer end
+        if k <= n - k:
+            new_front = self.sentinel_back.prev
+            for _ in range(k - 1):
+                new_front = new_front.prev
+        else:
+            new_front = self.sentinel_front.next
+            for _ in range(n - k):
+                new_front = new_front.next
+
+        new_back = new_front.prev
+        old_front = self.sentinel_front.next
+        old_back = self.sentinel_back.prev
+
+        # Close the items into a ring, then cut it between new_back and new_front
+        old_back.next = old_front
+        old_front.prev = old_back
+
+        self.sentinel_front.next = new_front
+        new_front.prev = self.sentinel_front
+        self.sentinel_back.prev = new_back
+        new_back.next = self.sentinel_back
+
+    def reverse(self) -> None:
+        """
+        Reverse the list in place by swapping the links of every node.
+        Time complexity: O(n)
+
+        :return: None
+        """
+        if self._size <= 1:
+            return
+
+        first = self.sentinel_front.next
+        last = self.sentinel_back.prev
+
+        node = first
+        while not node.sentinel:
+            node.prev, node.next = node.next, node.prev
+            node = node.prev
+
+        first.next = self.sentinel_back
+        last.prev = self.sentinel_front
+        self.sentinel_front.next = last
+        self.sentinel_back.prev = first
+
+    def cursor(self) -> Cursor:
+        """
+        Returns a cursor on the first element (past the end if empty).
+
+        :return: A new Cursor
+        """
+        return Cursor(self, self.sentinel_front.next)
+
+    def remove_if(self, pred) -> int:
+        """
+        Remove every element for which pred(element) is true, in one pass.
+        Time complexity: O(n)
+
+        :param pred: Function taking an element, returning a bool
+        :return: Number of elements removed
+        """
+        removed = 0
+        node = self.sentinel_front.next
+
+        while not node.sentinel:
+            next_node = node.next
+            if pred(node.item):
+                node.prev.next = next_node
+                next_node.prev = node.prev
+                node.next, node.prev = None, None
+                # Kept in step with the links in case pred raises
+                self._size -= 1
+                removed += 1
+            node = next_node
+
+        return removed
+
+    def filter_in_place(self, pred) -> None:
+        """
+        Keep only the elements for which pred(element) is true, in one pass.
+        Time complexity: O(n)
+
+        :param pred: Function taking an element, returning a bool
+        :return: None
+        """
+        self.remove_if(lambda item: not pred(item))
+
+    def walk(
+        self,
+        pos: Position | None = None,
+        steps: int | None = None,
+        reverse: bool = False,
+    ) -> BoundedNodeIterator:
+        """
+        Lazily iterate at most 'steps' elements, starting at 'pos'.
+        Nothing is copied, only the visited nodes are touched.
+
+        :raises IndexError: Invalid position
+        :raises ValueError: Negative steps
+        :param pos: Position to start at, the front (back if reverse) if None
+        :param steps: Maximum number of elements, unbounded if None
+        :param reverse: Walk towards the front instead of the back
+        :return: Iterator object.
+        """
+        if steps is not None and steps < 0:
+            raise ValueError("steps must be None or non-negative")
+
+        if pos is None:
+            node = self.sentinel_back.prev if reverse else self.sentinel_front.next
+        elif pos.node is None or pos.node.sentinel or pos.node.next is None:
+            raise IndexError("Invalid position")
+        else:
+            node = pos.node
+
+        node_end = self.sentinel_front if reverse else self.sentinel_back
+        return BoundedNodeIterator(node, node_end, steps, reverse)
+
+    def head(self, n: int) -> BoundedNodeIterator:
+        """
+        Lazily iterate the first n elements.
+        Time complexity: O(n)
+
+        :raises ValueError: Negative n
+        :return: Iterator object.
+        """
+        return self.walk(steps=n)
+
+    def tail(self, n: int) -> BoundedNodeIterator:
+        """
+        Lazily iterate the last n elements, front to back.
+        Time complexity: O(n)
+
+        :raises ValueError: Negative n
+        :return: Iterator object.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        n = min(n, self._size)
+
+        node = self.sentinel_back
+        for _ in range(n):
+            node = node.prev
+
+        return BoundedNodeIterator(node, self.sentinel_back, n)
+
+    def write(self, file, limit: int | None = None) -> None:
+        """
+        Write the list to a file object element by element, in the same
+        format as str(), without building one giant string.
+
+        :raises ValueError: Negative limit
+        :param file: Object with a write(str) method
+        :param limit: Maximum number of elements written, unbounded if None
+        :return: None
+        """
+        write_items(self, file, limit, self._size)
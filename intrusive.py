@@ -0,0 +1,361 @@
+#
+# Gagnaskipan.
+# Intrusive Double-Linked-List
+# Student(s):
+#  - Ísak Elí Hauksson
+#
+# The objects stored are their own nodes: they carry the prev/next links
+# in their own slots, so there is no separate Node or Position per item.
+# Each link field is a set of slots named "<field>_prev", "<field>_next" and
+# "<field>_owner" (the default field is "_link", see Linked), so
+# one object can sit in several lists at once, one per field. The owner slot
+# records which list the object is in, so a list never unlinks another
+# list's objects:
+#
+#     class Task:
+#         __slots__ = ("name",) + link_slots("run", "wait")
+#
+#     run_queue = IntrusiveList("run")
+#     wait_queue = IntrusiveList("wait")
+#
+
+
+def link_slots(*fields: str) -> tuple:
+    """
+    Returns the slot names needed to link an object into lists using the
+    given link fields, for use in a class's __slots__.
+
+    :param fields: Link field names
+    :return: Tuple of slot names
+    """
+    names = []
+    for field in fields:
+        names += [field + "_prev", field + "_next", field + "_owner"]
+    return tuple(names)
+
+
+class Linked:
+    # Mixin for classes that only need the default link field. The slot
+    # names are private so they do not clash with the class's own attributes.
+    __slots__ = ["_link_prev", "_link_next", "_link_owner"]
+
+
+class _Sentinel:
+    # Plain object, so it can hold the links of any field name
+    pass
+
+
+class IntrusiveList:
+    """
+    **Same Methods As DLList**
+
+    - `is_empty()`: Returns True if empty
+    - `front()`: Return the first object without removing it.
+    - `back()`: Return the last object without removing it.
+    - `push_front(obj)`: Link `obj` at the front.
+    - `push_back(obj)`: Link `obj` at the back.
+    - `pop_front()`: Unlink first object return None.
+    - `pop_back()`: Unlink last object return None.
+
+    **Intrusive Only**
+
+    - `insert_after(obj, new)` / `insert_before(obj, new)`: Link next to `obj`.
+    - `unlink(obj)`: Remove `obj` from the list in O(1), no lookup needed.
+    - `is_linked(obj)`: True if `obj` is in this list.
+    """
+
+    __slots__ = ["_prev", "_next", "_owner", "_sentinel", "_size"]
+
+    def __init__(self, field: str | None = None):
+        """
+        Create an empty list over the given link field.
+
+        :param field: Link field name, None for the "_link" slots of Linked
+        """
+        if field is None:
+            field = "_link"
+        self._prev: str = field + "_prev"
+        self._next: str = field + "_next"
+        self._owner: str = field + "_owner"
+        self._size = 0
+
+        # Single circular sentinel: its next is the front, its prev the back
+        self._sentinel = _Sentinel()
+        setattr(self._sentinel, self._prev, self._sentinel)
+        setattr(self._sentinel, self._next, self._sentinel)
+
+    def __iter__(self):
+        """
+        Iterate from the front to the back.
+        The current object may be unlinked while iterating, but unlinking
+        the next one makes the iterator raise.
+
+        :raises RuntimeError: If the next object was unlinked meanwhile
+        :return: Iterator object.
+        """
+        sentinel, next = self._sentinel, self._next
+        obj = getattr(sentinel, next)
+        while obj is not sentinel:
+            following = getattr(obj, next)
+            yield obj
+            self._check_iteration(following)
+            obj = following
+
+    def __reversed__(self):
+        """
+        Iterate from the back to the front.
+        The current object may be unlinked while iterating, but unlinking
+        the previous one makes the iterator raise.
+
+        :raises RuntimeError: If the previous object was unlinked meanwhile
+        :return: Iterator object.
+        """
+        sentinel, prev = self._sentinel, self._prev
+        obj = getattr(sentinel, prev)
+        while obj is not sentinel:
+            preceding = getattr(obj, prev)
+            yield obj
+            self._check_iteration(preceding)
+            obj = preceding
+
+    def _check_iteration(self, obj) -> None:
+        """
+        Helper function for the iterators, raises if the object they are
+        about to step to is no longer in this list.
+
+        :raises RuntimeError: If obj was unlinked
+        """
+        if obj is not self._sentinel and getattr(obj, self._owner, None) is not self:
+            raise RuntimeError("list changed during iteration")
+
+    def __str__(self):
+        """
+        String representation of the list.
+        Time complexity: O(n)
+
+        :return: The string representation.
+        """
+        return "[" + ", ".join(str(x) for x in self) + "]"
+
+    def __len__(self):
+        """
+        Returns the number of objects in the list.
+        Time complexity: O(1)
+        :return: Number of objects in the list.
+        """
+        return self._size
+
+    def is_empty(self):
+        """
+        Checks if list is empty.
+        Time complexity: O(1)
+
+        :return: True if empty, otherwise false
+        """
+        return self._size == 0
+
+    def is_linked(self, obj) -> bool:
+        """
+        Checks if obj is in this list.
+        Time complexity: O(1)
+
+        :return: True if linked into this list, otherwise false
+        """
+        return getattr(obj, self._owner, None) is self
+
+    def _link(self, prev, obj, next) -> None:
+        """
+        Helper function that links obj between prev and next.
+
+        :raises ValueError: If obj is already in a list using this field
+        """
+        if getattr(obj, self._owner, None) is not None:
+            raise ValueError("Object is already linked")
+
+        setattr(obj, self._owner, self)
+        setattr(obj, self._prev, prev)
+        setattr(obj, self._next, next)
+        setattr(prev, self._next, obj)
+        setattr(next, self._prev, obj)
+
+        self._size += 1
+
+    def insert_after(self, obj, new) -> None:
+        """
+        Link 'new' right after 'obj', which must be in this list.
+        Time complexity: O(1)
+
+        :raises ValueError: If obj is not in this list or new is already linked
+        :return: None
+        """
+        if not self.is_linked(obj):
+            raise ValueError("Object is not in this list")
+        self._link(obj, new, getattr(obj, self._next))
+
+    def insert_before(self, obj, new) -> None:
+        """
+        Link 'new' right before 'obj', which must be in this list.
+        Time complexity: O(1)
+
+        :raises ValueError: If obj is not in this list or new is already linked
+        :return: None
+        """
+        if not self.is_linked(obj):
+            raise ValueError("Object is not in this list")
+        self._link(getattr(obj, self._prev), new, obj)
+
+    def unlink(self, obj) -> None:
+        """
+        Remove obj from the list.
+        Time complexity: O(1)
+
+        :raises ValueError: If obj is not in this list
+        :return: None
+        """
+        if not self.is_linked(obj):
+            raise ValueError("Object is not in this list")
+
+        prev = getattr(obj, self._prev)
+        next = getattr(obj, self._next)
+        setattr(prev, self._next, next)
+        setattr(next, self._prev, prev)
+
+        setattr(obj, self._prev, None)
+        setattr(obj, self._next, None)
+        setattr(obj, self._owner, None)
+
+        self._size -= 1
+
+    def front(self):
+        """
+        Returns the object at the front of the list.
+        Time complexity: O(1)
+
+        :return: If list non-empty, the front object, otherwise trows an exception.
+        """
+        if self.is_empty():
+            raise IndexError("The list is empty")
+        return getattr(self._sentinel, self._next)
+
+    def back(self):
+        """
+        Returns the object at the back of the list.
+        Time complexity: O(1)
+
+        :return: If list non-empty, the back object, otherwise trows an exception.
+        """
+        if self.is_empty():
+            raise IndexError("The list is empty")
+        return getattr(self._sentinel, self._prev)
+
+    def push_front(self, obj) -> None:
+        """
+        Link an object at the front of the list.
+        Time complexity: O(1)
+
+        :raises ValueError: If obj is already in a list using this field
+        :return: None
+        """
+        self._link(self._sentinel, obj, getattr(self._sentinel, self._next))
+
+    def push_back(self, obj) -> None:
+        """
+        Link an object at the back of the list.
+        Time complexity: O(1)
+
+        :raises ValueError: If obj is already in a list using this field
+        :return: None
+        """
+        self._link(getattr(self._sentinel, self._prev), obj, self._sentinel)
+
+    def pop_front(self) -> None:
+        """
+        Unlink the object at the front of the list.
+        Time complexity: O(1)
+
+        :return: None, but trows an exception if list empty.
+        """
+        self.unlink(self.front())
+
+    def pop_back(self) -> None:
+        """
+        Unlink the object at the back of the list.
+        Time complexity: O(1)
+
+        :return: None, but trows an exception if list empty.
+        """
+        self.unlink(self.back())
+
+
+class _Item:
+    __slots__ = ["value"]
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _LinkedItem(Linked):
+    __slots__ = ["value"]
+
+    def __init__(self, value):
+        self.value = value
+
+
+def main():
+    """
+    Benchmark memory and speed against DLList with a dict from item to Position.
+    """
+    import time
+    import tracemalloc
+
+    from dll import DLList, Position
+
+    n = 200_000
+
+    # Memory of the items plus the list structure, since the intrusive
+    # items are larger by their three link slots
+    tracemalloc.start()
+    items = [_Item(i) for i in range(n)]
+    lst = DLList()
+    positions = {}
+    for item in items:
+        positions[item] = lst.insert_before(Position(lst.sentinel_back), item)
+    wrapped_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del lst, positions, items
+
+    tracemalloc.start()
+    linked_items = [_LinkedItem(i) for i in range(n)]
+    intrusive = IntrusiveList()
+    for item in linked_items:
+        intrusive.push_back(item)
+    intrusive_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del intrusive, linked_items
+
+    print(f"{'memory, DLList + dict':30} {wrapped_memory / n:.1f} bytes/item")
+    print(f"{'memory, IntrusiveList':30} {intrusive_memory / n:.1f} bytes/item")
+
+    # Speed of linking every item and then unlinking each one by identity
+    items = [_Item(i) for i in range(n)]
+    start = time.perf_counter()
+    lst = DLList()
+    positions = {}
+    for item in items:
+        positions[item] = lst.insert_before(Position(lst.sentinel_back), item)
+    for item in items:
+        lst.remove(positions.pop(item))
+    print(f"{'speed, DLList + dict':30} {time.perf_counter() - start:.3f}s")
+
+    linked_items = [_LinkedItem(i) for i in range(n)]
+    start = time.perf_counter()
+    intrusive = IntrusiveList()
+    for item in linked_items:
+        intrusive.push_back(item)
+    for item in linked_items:
+        intrusive.unlink(item)
+    print(f"{'speed, IntrusiveList':30} {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,3 +12,51 @@ class NodeIterator:
         item = self.__node.item
         self.__node = self.__node.next
         return item
+
+
+class BoundedNodeIterator:
+    def __init__(self, node, node_end=None, steps=None, reverse=False):
+        self.__node = node
+        self.__node_end = node_end
+        self.__steps = steps
+        self.__reverse = reverse
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.__node is None or self.__node is self.__node_end or self.__steps == 0:
+            raise StopIteration
+        if self.__steps is not None:
+            self.__steps -= 1
+        item = self.__node.item
+        self.__node = self.__node.prev if self.__reverse else self.__node.next
+        return item
+
+
+def write_items(items, file, limit=None, length=None):
+    """
+    Writes "[a, b, c]" to a file object one element at a time, without
+    building the whole string. Stops after 'limit' elements and writes
+    "..." (with the number left, if 'length' is known) instead of the rest.
+    Raises ValueError if 'limit' is negative.
+    """
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be None or non-negative")
+
+    file.write("[")
+    count = 0
+    for item in items:
+        if limit is not None and count == limit:
+            if count:
+                file.write(", ")
+            if length is None:
+                file.write("...")
+            else:
+                file.write(f"... ({length - limit} more)")
+            break
+        if count:
+            file.write(", ")
+        file.write(str(item))
+        count += 1
+    file.write("]")
@@ -0,0 +1,279 @@
+#
+# Gagnaskipan.
+# Sliding-window aggregates
+# Student(s):
+#  - Ísak Elí Hauksson
+#
+import time
+
+from deque import Deque
+from dll import DLList
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SlidingWindow:
+    """
+    Rolling min/max/sum/mean over the most recent samples of a stream.
+
+    - `push(value, timestamp)`: Add a sample, evicting those that fell out.
+    - `push_many(values, timestamps)`: Add a batch of samples.
+    - `min()`, `max()`, `sum()`, `mean()`: Aggregates over the window.
+
+    The window is either count-based (the last `size` samples) or
+    time-based (samples newer than `duration` before the latest timestamp).
+    Min and max are kept in monotonic deques and sum in a compensated
+    running accumulator, so every sample costs amortized O(1).
+    """
+
+    def __init__(self, size: int | None = None, duration: float | None = None):
+        """
+        Constructor. Exactly one of size and duration must be given.
+
+        :param size: Number of samples in a count-based window
+        :param duration: Length of a time-based window
+        :raises ValueError: If not exactly one of them is given, or it is not positive.
+        """
+        if (size is None) == (duration is None):
+            raise ValueError("give exactly one of size and duration")
+        if size is not None and size < 1:
+            raise ValueError("size must be positive")
+        if duration is not None and duration <= 0:
+            raise ValueError("duration must be positive")
+
+        self._size = size
+        self._duration = duration
+        self.clear()
+
+    def __len__(self):
+        """
+        Returns the number of samples in the window.
+        Time complexity: O(1)
+        """
+        return len(self._window)
+
+    def __str__(self):
+        """
+        Returns the string representation of the window aggregates.
+        """
+        if self.is_empty():
+            return "SlidingWindow([])"
+        return (
+            f"SlidingWindow(n={len(self)}, min={self.min()}, max={self.max()}, "
+            f"sum={self.sum()}, mean={self.mean()})"
+        )
+
+    def is_empty(self):
+        """
+        Returns True if the window holds no samples, otherwise False.
+        """
+        return self._window.is_empty()
+
+    def clear(self) -> None:
+        """
+        Removes every sample from the window.
+
+        :return: None
+        """
+        # Entries are (index, timestamp, value) in the window and
+        # (index, value) in the monotonic deques.
+        self._window: Deque = Deque(DLList())
+        self._mins: Deque = Deque(DLList())
+        self._maxs: Deque = Deque(DLList())
+        self._index = 0
+        self._sum = 0
+        self._compensation = 0
+        self._last_time = None
+
+    def push(self, value, timestamp: float | None = None) -> None:
+        """
+        Adds a sample to the window and evicts the samples that fell out.
+        Time complexity: amortized O(1)
+
+        :param value: The sample
+        :param timestamp: Time of the sample, time.monotonic() if omitted.
+            Only used by time-based windows and must never decrease.
+        :raises ValueError: If the timestamp is older than the previous one.
+        :return: None
+        """
+        if self._duration is not None:
+            if timestamp is None:
+                timestamp = time.monotonic()
+            if self._last_time is not None and timestamp < self._last_time:
+                raise ValueError("timestamps must be non-decreasing")
+            self._last_time = timestamp
+
+        index = self._index
+        self._index += 1
+
+        self._window.append((index, timestamp, value))
+        self._add(value)
+
+        # Drop entries that can never be the min/max again
+        mins = self._mins
+        while not mins.is_empty() and mins.back()[1] >= value:
+            mins.pop()
+        mins.append((index, value))
+
+        maxs = self._maxs
+        while not maxs.is_empty() and maxs.back()[1] <= value:
+            maxs.pop()
+        maxs.append((index, value))
+
+        self._evict()
+
+    def push_many(self, values, timestamps=None) -> None:
+        """
+        Adds a batch of samples, in order.
+        Accepts any iterable, including NumPy arrays when NumPy is available.
+        This is not vectorized: arrays are converted with tolist() and each
+        sample then goes through push(). The only batch saving is that a
+        count-based window skips all but the last `size` samples of a batch
+        that is longer than the window, since the rest would be evicted anyway.
+
+        :param values: The samples
+        :param timestamps: Matching timestamps, see push()
+        :return: None
+        """
+        if np is not None:
+            # Plain Python numbers are much faster to compare and add
+            if isinstance(values, np.ndarray):
+                values = values.tolist()
+            if isinstance(timestamps, np.ndarray):
+                timestamps = timestamps.tolist()
+
+        if timestamps is not None:
+            for value, timestamp in zip(values, timestamps):
+                self.push(value, timestamp)
+            return
+
+        if self._size is not None:
+            if not isinstance(values, (list, tuple)):
+                values = list(values)
+            skipped = len(values) - self._size
+            if skipped > 0:
+                self.clear()
+                self._index = skipped
+                values = values[skipped:]
+
+        for value in values:
+            self.push(value)
+
+    def _add(self, value) -> None:
+        """
+        Helper function that adds value to the running sum with Neumaier
+        compensated summation, so evicting a large sample does not cancel
+        the small ones that were added after it.
+
+        :return: None
+        """
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def _evict(self) -> None:
+        """
+        Helper function that removes samples that fell out of the window.
+
+        :return: None
+        """
+        window = self._window
+
+        while not window.is_empty():
+            index, timestamp, value = window.front()
+            if self._size is not None:
+                if len(window) <= self._size:
+                    return
+            elif timestamp > self._last_time - self._duration:
+                return
+
+            window.popleft()
+            self._add(-value)
+
+            if self._mins.front()[0] == index:
+                self._mins.popleft()
+            if self._maxs.front()[0] == index:
+                self._maxs.popleft()
+
+    def min(self):
+        """
+        Returns the smallest sample in the window.
+        Time complexity: O(1)
+
+        :return: If non-empty, the minimum, otherwise raises exception.
+        """
+        return self._mins.front()[1]
+
+    def max(self):
+        """
+        Returns the largest sample in the window.
+        Time complexity: O(1)
+
+        :return: If non-empty, the maximum, otherwise raises exception.
+        """
+        return self._maxs.front()[1]
+
+    def sum(self):
+        """
+        Returns the sum of the samples in the window.
+        Time complexity: O(1)
+
+        :return: The sum, 0 if empty.
+        """
+        return self._sum + self._compensation
+
+    def mean(self):
+        """
+        Returns the mean of the samples in the window.
+        Time complexity: O(1)
+
+        :return: If non-empty, the mean, otherwise raises exception.
+        """
+        if self.is_empty():
+            raise IndexError("mean called on an empty window")
+        return self.sum() / len(self._window)
+
+
+def main():
+    """
+    Benchmark against naively rescanning the window on every sample.
+    Both start from a full window; the time per sample (push plus reading
+    min/max/sum/mean) is reported. The rescan is timed on fewer samples for
+    large windows, since each of its samples costs O(size).
+    """
+    import random
+    from collections import deque
+
+    for size in (10, 1000, 100_000):
+        prefill = [random.random() for _ in range(size)]
+        samples = [random.random() for _ in range(20_000)]
+
+        window = SlidingWindow(size=size)
+        window.push_many(prefill)
+        start = time.perf_counter()
+        for value in samples:
+            window.push(value)
+            window.min(), window.max(), window.sum(), window.mean()
+        fast = (time.perf_counter() - start) / len(samples)
+
+        buffer = deque(prefill, maxlen=size)
+        naive_samples = samples[: max(20, 2_000_000 // size)]
+        start = time.perf_counter()
+        for value in naive_samples:
+            buffer.append(value)
+            min(buffer), max(buffer), sum(buffer) / len(buffer)
+        naive = (time.perf_counter() - start) / len(naive_samples)
+
+        print(
+            f"size={size:<8} SlidingWindow {fast * 1e6:9.1f} us/sample"
+            f"   naive rescan {naive * 1e6:9.1f} us/sample"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,10 @@
 # Student(s):
 #  - Ísak Elí Hauksson
 #
+import io
+
 from sll_node import Node
-from iterator import NodeIterator
+from iterator import NodeIterator, write_items
 
 
 class SLList:
@@ -19,8 +21,16 @@ class SLList:
     - `push_back(item)`: Insert `item` at the back.
     - `pop_front()`: Remove first item return None.
     - `pop_back()`: Remove last item return None.
+    - `replace_front(item)`: Replace the first item, return the old one.
+    - `replace_back(item)`: Replace the last item, return the old one.
+    - `rotate(k)`: Rotate `k` steps to the right (left if negative).
+    - `reverse()`: Reverse the list in place.
+    - `write(file, limit)`: Stream the list to a file object.
     """
 
+    # Number of elements shown by repr() before truncating
+    REPR_LIMIT = 100
+
     def __init__(self):
         """
         Constructor.
@@ -50,6 +60,16 @@ class SLList:
             node = node.next
         return "[" + ", ".join(elems) + "]"
 
+    def __repr__(self):
+        """
+        Truncated string representation, showing at most REPR_LIMIT elements.
+        Time complexity: O(REPR_LIMIT)
+        :return: The string representation.
+        """
+        out = io.StringIO()
+        self.write(out, self.REPR_LIMIT)
+        return out.getvalue()
+
     def __len__(self):
         """
         Returns the number of elements in the list.
@@ -166,3 +186,103 @@ class SLList:
         self._tail = prev
 
         self._len -= 1
+
+    def replace_front(self, item):
+        """
+        Replace the element at the front of the list.
+        Time complexity: O(1)
+        :param item: New element
+        :return: The element replaced, but trows an exception if list empty.
+        """
+        if self.is_empty():
+            raise IndexError("replace_front called on an empty list")
+        existing_item = self._head.item
+        self._head.item = item
+        return existing_item
+
+    def replace_back(self, item):
+        """
+        Replace the element at the back of the list.
+        Time complexity: O(1)
+        :param item: New element
+        :return: The element replaced, but trows an exception if list empty.
+        """
+        if self.is_empty():
+            raise IndexError("replace_back called on an empty list")
+        existing_item = self._tail.item
+        self._tail.item = item
+        return existing_item
+
+    def _recycle_front(self, item):
+        """
+        Helper function for bounded deques: evicts the front element and
+        reuses its node to append 'item' at the back.
+        Time complexity: O(1)
+        :param item: New element
+        :return: The element evicted, but trows an exception if list empty.
+        """
+        existing_item = self.replace_front(item)
+        self.rotate(-1)
+        return existing_item
+
+    def _recycle_back(self, item):
+        """
+        Helper function for bounded deques: evicts the back element and
+        reuses its node to prepend 'item' at the front.
+        Time complexity: O(n), since the node before the tail must be found
+        :param item: New element
+        :return: The element evicted, but trows an exception if list empty.
+        """
+        existing_item = self.replace_back(item)
+        self.rotate(1)
+        return existing_item
+
+    def rotate(self, k=1):
+        """
+        Rotate the list k steps to the right (to the left if k is negative).
+        Relinks the existing nodes, no nodes are allocated.
+        Time complexity: O(n - k), so O(1) for rotate(-1)
+        :param k: Number of steps
+        :return: None
+        """
+        n = self._len
+        if n <= 1:
+            return
+
+        k %= n
+        if k == 0:
+            return
+
+        # Find the node that becomes the new tail
+        new_tail = self._head
+        for _ in range(n - k - 1):
+            new_tail = new_tail.next
+
+        self._tail.next = self._head
+        self._head = new_tail.next
+        new_tail.next = None
+        self._tail = new_tail
+
+    def reverse(self):
+        """
+        Reverse the list in place.
+        Time complexity: O(n)
+        :return: None
+        """
+        prev = None
+        node = self._head
+        while node is not None:
+            node.next, prev, node = prev, node, node.next
+
+        self._head, self._tail = self._tail, self._head
+
+    def write(self, file, limit=None):
+        """
+        Write the list to a file object element by element, in the same
+        format as str(), without building one giant string.
+        :raises ValueError: Negative limit
+        :param file: Object with a write(str) method
+        :param limit: Maximum number of elements written, unbounded if None
+        :return: None
+        """
+        write_items(self, file, limit, self._len)
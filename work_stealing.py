@@ -0,0 +1,347 @@
+#
+# Gagnaskipan.
+# Work-stealing deque and task scheduler
+# Student(s):
+#  - Ísak Elí Hauksson
+#
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+
+from deque import Deque
+from dll import DLList
+
+
+class WorkStealingDeque:
+    """
+    Deque shared between one owner thread and any number of thieves.
+
+    - `append(item)`: Owner pushes a task on its own (back) end.
+    - `pop()`: Owner takes the newest task from the back (LIFO).
+    - `popleft()`: Thief takes the oldest task from the front (FIFO).
+
+    Every operation is a handful of O(1) relinks on the underlying DLList,
+    so the lock is only held for a few bytecodes at a time.
+
+    This is a deliberate simplification for CPython: the owner takes the
+    same lock as the thieves on every append/pop, and only the empty check
+    is done without it. A lock-free owner end (as in Chase-Lev deques)
+    relies on atomic index updates that the DLList relinks do not have.
+    """
+
+    __slots__ = ["_deque", "_lock"]
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self._deque: Deque = Deque(DLList())
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Returns the number of tasks in the deque.
+        Time complexity: O(1)
+        """
+        return len(self._deque)
+
+    def __str__(self):
+        """
+        Returns the string representation of the deque.
+        """
+        return str(self._deque)
+
+    def is_empty(self):
+        """
+        Returns True if the deque is empty, otherwise False.
+        """
+        return self._deque.is_empty()
+
+    def append(self, item) -> None:
+        """
+        Inserts the task at the owner (back) end.
+        Time complexity: O(1)
+
+        :param item: Task to insert
+        :return: None
+        """
+        with self._lock:
+            self._deque.append(item)
+
+    def pop(self) -> object | None:
+        """
+        Removes and returns the task at the owner (back) end.
+        Time complexity: O(1)
+
+        :return: The newest task, or None if empty.
+        """
+        # Unlocked peek so an idle owner does not contend with thieves
+        if self._deque.is_empty():
+            return None
+        with self._lock:
+            if self._deque.is_empty():
+                return None
+            item = self._deque.back()
+            self._deque.pop()
+            return item
+
+    def popleft(self) -> object | None:
+        """
+        Removes and returns the task at the thief (front) end.
+        Time complexity: O(1)
+
+        :return: The oldest task, or None if empty.
+        """
+        if self._deque.is_empty():
+            return None
+        with self._lock:
+            if self._deque.is_empty():
+                return None
+            item = self._deque.front()
+            self._deque.popleft()
+            return item
+
+
+class WorkStealingScheduler:
+    """
+    Thread pool running `num_workers` workers, each owning a WorkStealingDeque.
+
+    - `submit(fn, *args, **kwargs)`: Schedule a call, returns a Future.
+    - `map(fn, iterable)`: Schedule fn over iterable, yields results in order.
+    - `join()`: Block until every submitted task has finished.
+    - `shutdown(wait)`: Stop the workers.
+
+    Tasks submitted from outside the pool are dealt round-robin over the
+    workers. Tasks submitted from inside a worker go onto that worker's own
+    deque. An idle worker first drains its own deque and then steals from
+    the others, unless `steal` is False.
+
+    A task must not block on the Future of another task: waiting workers
+    do not help, so this can deadlock the pool.
+    """
+
+    def __init__(self, num_workers: int = 4, steal: bool = True):
+        """
+        Constructor. Starts the worker threads.
+
+        :param num_workers: Number of worker threads
+        :param steal: Whether idle workers steal from the others
+        :raises ValueError: If num_workers is less than 1
+        """
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+
+        self._deques: list[WorkStealingDeque] = [
+            WorkStealingDeque() for _ in range(num_workers)
+        ]
+        self._steal = steal
+        self._next = 0
+        self._pending = 0
+        self._shutdown = False
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+        self._threads: list[threading.Thread] = []
+        for index in range(num_workers):
+            thread = threading.Thread(target=self._worker, args=(index,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def __len__(self):
+        """
+        Returns the number of workers.
+        """
+        return len(self._deques)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown(wait=True)
+        return False
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Schedule fn(*args, **kwargs) to run on one of the workers.
+
+        :raises RuntimeError: If the scheduler has been shut down
+        :return: Future holding the result of the call
+        """
+        future: Future = Future()
+
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            self._pending += 1
+
+            index = getattr(self._local, "index", None)
+            if index is None:
+                index = self._next
+                self._next = (self._next + 1) % len(self._deques)
+
+        self._deques[index].append((future, fn, args, kwargs))
+
+        with self._cond:
+            self._cond.notify_all()
+
+        return future
+
+    def map(self, fn, iterable):
+        """
+        Schedule fn over every element of iterable.
+        All calls are submitted before the first result is awaited.
+
+        :return: Generator yielding the results in input order
+        """
+        futures = [self.submit(fn, item) for item in iterable]
+
+        def results():
+            for future in futures:
+                yield future.result()
+
+        return results()
+
+    def join(self) -> None:
+        """
+        Block until every submitted task has finished.
+
+        :return: None
+        """
+        with self._cond:
+            while self._pending:
+                self._cond.wait()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the workers once their deques are drained.
+
+        :param wait: Block until the worker threads have exited
+        :return: None
+        """
+        if wait:
+            self.join()
+
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _find_task(self, index: int):
+        """
+        Helper function for the workers.
+        Pops from the worker's own deque, or steals from a random victim.
+
+        :param index: Index of the calling worker
+        :return: A task tuple, or None if nothing was found
+        """
+        task = self._deques[index].pop()
+        if task is not None or not self._steal:
+            return task
+
+        count = len(self._deques)
+        start = random.randrange(count)
+        for offset in range(count):
+            victim = (start + offset) % count
+            if victim != index:
+                task = self._deques[victim].popleft()
+                if task is not None:
+                    return task
+        return None
+
+    def _worker(self, index: int) -> None:
+        """
+        Main loop of a worker thread.
+
+        :param index: Index of the worker's own deque
+        :return: None
+        """
+        self._local.index = index
+
+        while True:
+            task = self._find_task(index)
+
+            if task is None:
+                with self._cond:
+                    if self._shutdown:
+                        return
+                    # Timeout guards against a notify racing the empty check
+                    self._cond.wait(0.01)
+                continue
+
+            future, fn, args, kwargs = task
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+
+            with self._cond:
+                self._pending -= 1
+                if not self._pending:
+                    self._cond.notify_all()
+
+
+def _skewed_task(cost: float) -> float:
+    time.sleep(cost)
+    return cost
+
+
+def _thread_pool_baseline(num_workers: int, costs: list) -> float:
+    """
+    Time ThreadPoolExecutor on the same workload.
+    The local queue.py shadows the stdlib module ThreadPoolExecutor needs,
+    so it runs in an isolated interpreter without this directory on sys.path.
+    """
+    baseline = f"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+def task(cost):
+    time.sleep(cost)
+    return cost
+
+with ThreadPoolExecutor({num_workers}) as pool:
+    start = time.perf_counter()
+    list(pool.map(task, {costs!r}))
+    print(time.perf_counter() - start)
+"""
+    result = subprocess.run(
+        [sys.executable, "-I", "-c", baseline],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout)
+
+
+def main():
+    """
+    Benchmark on a skewed workload: every 8th task is heavy, so round-robin
+    dealing puts all of the heavy tasks on one worker. The same workload is
+    run with 1, 2, 4 and 8 workers to show how each pool scales.
+    """
+    costs = [0.02 if i % 8 == 0 else 0.0005 for i in range(800)]
+
+    print(f"{'workers':>8} {'no stealing':>12} {'stealing':>12} {'ThreadPool':>12}")
+    for num_workers in (1, 2, 4, 8):
+        timings = []
+        for steal in (False, True):
+            with WorkStealingScheduler(num_workers, steal=steal) as pool:
+                start = time.perf_counter()
+                list(pool.map(_skewed_task, costs))
+                timings.append(time.perf_counter() - start)
+        timings.append(_thread_pool_baseline(num_workers, costs))
+
+        print(f"{num_workers:>8}" + "".join(f"{t:>11.3f}s" for t in timings))
+
+
+if __name__ == "__main__":
+    main()